@@ -7,18 +7,153 @@ import sys
 import os
 import time
 import curses
+import threading
 
 
 def load_text(filepath):
+    # Stream line by line: one string per line instead of a whole-file
+    # string plus token list. Splitting after decode keeps str.split's
+    # Unicode whitespace handling (NBSP, em space), which bytes.split
+    # would let through and misalign the centering.
+    buf = []
     with open(filepath, 'r', encoding='utf-8') as f:
-        text = f.read()
-    return ' '.join(text.split())
+        for line in f:
+            line = ' '.join(line.split())
+            if line:
+                buf.append(line)
+    return ' '.join(buf)
 
 
-def run_marquee(stdscr, text):
+SPEED_STEP = 2
+MAX_SPEED = 40
+
+# Speed only changes on keypress, so status strings repeat for
+# thousands of frames; cache them by speed bucket
+_status_cache = {}
+
+
+def _marquee_status(speed):
+    key = int(speed * 10)
+    status = _status_cache.get(key)
+    if status is None:
+        if speed == 0:
+            status = "PAUSED | → start | Q quit"
+        else:
+            direction = "→" if speed > 0 else "←"
+            status = f"{direction} {abs(speed):.0f} c/s | →/← adjust | SPACE pause"
+        _status_cache[key] = status
+    return status
+
+
+def run_marquee(text, *, use_curses=True):
+    """Single marquee entry point: curses normally, raw ANSI fallback."""
+    if use_curses:
+        curses.wrapper(lambda stdscr: _run_marquee_curses(stdscr, text))
+    else:
+        _run_marquee_ansi(text)
+
+
+def _run_marquee_ansi(text):
+    import select
+    import termios
+    import tty
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    size = os.get_terminal_size()
+    w, h = size.columns, size.lines
+
+    padded = ' ' * w + text + ' ' * w
+    ring = padded + padded[:w]
+    total_len = len(text) + w
+
+    offset = 0.0
+    speed = 0.0
+    last_oi = -1
+    last_status = None
+    last_ns = time.perf_counter_ns()
+
+    # Raw fd writes: no TextIOWrapper lock or codec on the hot path
+    out_fd = sys.stdout.fileno()
+    sys.stdout.flush()
+    os.write(out_fd, b'\x1b[2J\x1b[?25l')
+    try:
+        tty.setcbreak(fd)
+        while True:
+            now_ns = time.perf_counter_ns()
+            dt = (now_ns - last_ns) * 1e-9
+            last_ns = now_ns
+
+            offset += speed * dt
+            if offset < 0:
+                offset = 0
+                speed = 0
+            if offset > total_len:
+                offset = total_len
+                speed = 0
+
+            frame = b''
+            oi = int(offset)
+            if oi != last_oi:
+                last_oi = oi
+                line = ring[oi:oi + w]
+                frame += f'\x1b[2;1H\x1b[1;97m{line[:w-1]}\x1b[0m'.encode('utf-8')
+
+            status = _marquee_status(speed)
+            if status != last_status:
+                last_status = status
+                frame += f'\x1b[{h};1H\x1b[90m{status[:w-1].ljust(w-1)}\x1b[0m'.encode('utf-8')
+
+            if frame:
+                os.write(out_fd, frame)
+
+            # Block while paused, otherwise wake at ~120Hz
+            timeout = None if speed == 0 else 0.008
+            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+            if timeout is None:
+                last_ns = time.perf_counter_ns()
+            if not ready:
+                continue
+
+            # Read the burst on the raw fd: stdin's buffered text layer
+            # would swallow the ESC [ C bytes in one gulp and a later
+            # select on the kernel fd would never see the tail
+            data = os.read(fd, 32)
+            while data.endswith((b'\x1b', b'\x1b[')):
+                # Arrow sequence split across reads; grab the rest
+                if not select.select([sys.stdin], [], [], 0.01)[0]:
+                    break
+                data += os.read(fd, 2)
+            quit_requested = False
+            i = 0
+            while i < len(data):
+                ch = chr(data[i])
+                i += 1
+                if ch in ('q', 'Q'):
+                    quit_requested = True
+                    break
+                elif ch == ' ':
+                    speed = 0
+                elif ch == '\x1b':
+                    # Arrow keys arrive as ESC [ C / ESC [ D
+                    seq = data[i:i + 2]
+                    if seq == b'[C':
+                        speed = min(speed + SPEED_STEP, MAX_SPEED)
+                        i += 2
+                    elif seq == b'[D':
+                        speed = max(speed - SPEED_STEP, -MAX_SPEED)
+                        i += 2
+            if quit_requested:
+                break
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        sys.stdout.write('\x1b[0m\x1b[?25h\x1b[2J\x1b[H')
+        sys.stdout.flush()
+
+
+def _run_marquee_curses(stdscr, text):
     curses.curs_set(0)
-    stdscr.nodelay(True)
-    
+
     curses.start_color()
     curses.use_default_colors()
     curses.init_pair(1, curses.COLOR_WHITE, -1)
@@ -28,19 +163,31 @@ def run_marquee(stdscr, text):
     
     padded = ' ' * w + text + ' ' * w
     total_len = len(text) + w
-    
+
+    # The whole line lives in a pad; scrolling is just a refresh with a
+    # column offset and curses only sends the diff to the terminal.
+    # ncurses caps pad dimensions at 32767, so longer scripts fall back
+    # to slicing the line into the screen each frame instead.
+    pad = None
+    if len(padded) + 1 <= 32767:
+        try:
+            pad = curses.newpad(2, len(padded) + 1)
+            pad.addstr(0, 0, padded, curses.A_BOLD)
+        except curses.error:
+            pad = None
+    last_oi = -1
+
     offset = 0.0
     speed = 0.0
-    speed_step = 2
-    max_speed = 40
-    
-    last_time = time.perf_counter()
-    last_offset_int = -1
-    
+
+    last_ns = time.perf_counter_ns()
+    last_bar = None
+    last_status = None
+
     while True:
-        now = time.perf_counter()
-        dt = now - last_time
-        last_time = now
+        now_ns = time.perf_counter_ns()
+        dt = (now_ns - last_ns) * 1e-9
+        last_ns = now_ns
         
         # Update position
         offset += speed * dt
@@ -53,33 +200,15 @@ def run_marquee(stdscr, text):
             offset = total_len
             speed = 0
         
-        # Only redraw if offset changed visually
-        current_offset_int = int(offset)
-        if current_offset_int != last_offset_int:
-            last_offset_int = current_offset_int
-            
-            # Get visible text
-            start = current_offset_int
-            visible = padded[start:start + w]
-            if len(visible) < w:
-                visible = visible.ljust(w)
-            
-            # Draw text at TOP
-            try:
-                stdscr.move(1, 0)
-                stdscr.attron(curses.A_BOLD)
-                stdscr.addstr(visible[:w-1])
-                stdscr.attroff(curses.A_BOLD)
-            except:
-                pass
-            
-            # Progress bar at BOTTOM
-            progress = offset / total_len if total_len > 0 else 0
-            bar_w = w - 12
-            filled = int(bar_w * min(progress, 1.0))
+        # Progress bar at BOTTOM, only when it visibly moved
+        progress = offset / total_len if total_len > 0 else 0
+        bar_w = w - 12
+        filled = int(bar_w * min(progress, 1.0))
+        pct = int(progress * 100)
+
+        if (filled, pct) != last_bar:
+            last_bar = (filled, pct)
             bar = '█' * filled + '░' * (bar_w - filled)
-            pct = int(progress * 100)
-            
             try:
                 stdscr.attron(curses.color_pair(2))
                 stdscr.move(h - 3, 0)
@@ -87,44 +216,50 @@ def run_marquee(stdscr, text):
                 stdscr.attroff(curses.color_pair(2))
             except:
                 pass
+
+        # Status, only when it changed
+        status = _marquee_status(speed)
+        if status != last_status:
+            last_status = status
+            try:
+                stdscr.attron(curses.color_pair(2))
+                stdscr.move(h - 1, 0)
+                stdscr.addstr(status[:w-1].ljust(w-1))
+                stdscr.attroff(curses.color_pair(2))
+            except:
+                pass
         
-        # Status (always update for speed display)
-        if speed == 0:
-            status = "PAUSED | → start | Q quit"
-        else:
-            direction = "→" if speed > 0 else "←"
-            status = f"{direction} {abs(speed):.0f} c/s | →/← adjust | SPACE pause"
-        
-        try:
-            stdscr.attron(curses.color_pair(2))
-            stdscr.move(h - 1, 0)
-            stdscr.addstr(status[:w-1].ljust(w-1))
-            stdscr.attroff(curses.color_pair(2))
-        except:
-            pass
-        
-        stdscr.refresh()
-        
-        # Input
+        oi = int(offset)
+        if pad is None and oi != last_oi:
+            last_oi = oi
+            try:
+                stdscr.addnstr(1, 0, padded[oi:oi + w], w - 1, curses.A_BOLD)
+            except curses.error:
+                pass
+
+        stdscr.noutrefresh()
+        if pad is not None:
+            pad.noutrefresh(0, oi, 1, 0, 1, w - 1)
+        curses.doupdate()
+
+        # Input: block in the kernel while paused, otherwise wake at ~120Hz
+        paused = speed == 0
+        stdscr.timeout(-1 if paused else 8)
         key = stdscr.getch()
-        
+        if paused:
+            # Don't count time spent blocked as scroll time
+            last_ns = time.perf_counter_ns()
+
         if key == ord('q'):
             break
         elif key == ord(' '):
             speed = 0
         elif key == curses.KEY_RIGHT:
             # Increase speed (or slow down if going backward)
-            speed += speed_step
-            if speed > max_speed:
-                speed = max_speed
+            speed = min(speed + SPEED_STEP, MAX_SPEED)
         elif key == curses.KEY_LEFT:
             # Decrease speed (or speed up backward)
-            speed -= speed_step
-            if speed < -max_speed:
-                speed = -max_speed
-        
-        # Small sleep to prevent CPU spinning
-        time.sleep(0.008)
+            speed = max(speed - SPEED_STEP, -MAX_SPEED)
 
 
 def main():
@@ -140,18 +275,33 @@ def main():
         print(f"Error: {args.script} not found")
         sys.exit(1)
     
-    text = load_text(args.script)
-    
-    if not text:
-        print("Error: No text")
-        sys.exit(1)
-    
-    print(f"📜 {len(text)} chars")
+    # Load in the background while the banner sleep runs; an exception
+    # is carried back and re-raised here instead of dying in the thread
+    loaded = []
+
+    def _load():
+        try:
+            loaded.append(load_text(args.script))
+        except Exception as e:
+            loaded.append(e)
+
+    loader = threading.Thread(target=_load, daemon=True)
+    loader.start()
+
     print("💡 Cmd + for bigger font")
     print("→ to start scrolling")
     time.sleep(1)
+
+    loader.join()
+    if isinstance(loaded[0], Exception):
+        raise loaded[0]
+    text = loaded[0]
+
+    if not text:
+        print("Error: No text")
+        sys.exit(1)
     
-    curses.wrapper(lambda stdscr: run_marquee(stdscr, text))
+    run_marquee(text, use_curses=os.environ.get('TERM') != 'dumb')
     print("Done! 🎬")
 
 
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Voice Prompter - voice-activated phrase mode.
+
+Shows one phrase at a time and advances when the speaker pauses.
+Speech detection runs in a background thread that watches the
+microphone continuously and notifies the main loop through a pipe, so
+the keyboard stays responsive.
+"""
+
+import json
+import math
+import os
+import queue
+import re
+import selectors
+import signal
+import sys
+import termios
+import threading
+import time
+import tty
+
+import pyaudio
+
+from .cli import load_text
+
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = 512  # 32ms per frame at 16kHz
+FRAME_SECONDS = FRAME_SAMPLES / SAMPLE_RATE
+CALIBRATION_SECONDS = 0.5
+
+
+def _frame_rms(data):
+    """RMS energy of a frame of native-endian 16-bit samples.
+
+    audioop left the stdlib in Python 3.13 (PEP 594); at 512 samples
+    per 32ms frame a plain sum of squares costs microseconds.
+    """
+    samples = memoryview(data).cast('h')
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+# Ambient calibration from a recent run is good enough to start with
+# (the noise-floor EWMA adapts from there), so cache it for warm starts
+CAL_FILE = os.path.expanduser('~/.voice_prompter_cal.json')
+CAL_MAX_AGE = 24 * 3600
+
+
+def _load_cached_noise():
+    try:
+        if time.time() - os.path.getmtime(CAL_FILE) > CAL_MAX_AGE:
+            return None
+        with open(CAL_FILE) as f:
+            return float(json.load(f)['noise_rms'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_cached_noise(noise):
+    try:
+        with open(CAL_FILE, 'w') as f:
+            json.dump({'noise_rms': noise}, f)
+    except OSError:
+        pass
+
+
+# Sentence boundaries and comma cuts in one alternation, so the text
+# is scanned once; which branch matched is told by the first character
+_CUT_RE = re.compile(r'(?<=[.!?])\s+|,\s*')
+_PARA_RE = re.compile(r'\n\s*\n')
+
+MAX_PHRASE_LEN = 150  # fragments longer than this break at commas too
+
+
+def split_into_phrases(text):
+    """Yield phrases in a single regex pass over the text.
+
+    Sentence ends always cut; a comma cuts only when the fragment
+    accumulated since the last cut is already over MAX_PHRASE_LEN.
+    """
+    last = 0
+    for m in _CUT_RE.finditer(text):
+        if text[m.start()] == ',' and m.start() - last <= MAX_PHRASE_LEN:
+            continue  # short fragment: the comma rides along
+        piece = text[last:m.start()].strip()
+        if piece:
+            yield piece
+        last = m.end()
+    tail = text[last:].strip()
+    if tail:
+        yield tail
+
+
+def split_into_paragraphs(text):
+    return [' '.join(p.split()) for p in _PARA_RE.split(text) if p.strip()]
+
+
+def _load_sentences(filepath):
+    return list(split_into_phrases(load_text(filepath)))
+
+
+def _load_paragraphs(filepath):
+    # Paragraph boundaries are blank lines, so this reads raw text
+    # rather than the whitespace-flattened load_text output
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return split_into_paragraphs(f.read())
+
+
+SPLITTERS = {'sentence': _load_sentences, 'paragraph': _load_paragraphs}
+
+
+_BOLD_WHITE = '\x1b[1;97m'
+_DIM = '\x1b[90m'
+_RESET = '\x1b[0m'
+_CLEAR_HOME = '\x1b[2J\x1b[H'
+
+
+def clear_screen():
+    sys.stdout.write(_CLEAR_HOME)
+    sys.stdout.flush()
+
+
+# Terminal size and wrapped phrases are computed once (and again on
+# SIGWINCH) instead of two ioctls plus a wrap loop per redraw.
+TERM_W, TERM_H = 80, 24
+_phrases = []
+_wrapped = []
+_frame_cache = {}
+_last_rows = None  # rows currently on screen; None forces a full repaint
+
+
+def _optimal_wrap(phrase, width):
+    """Minimum-raggedness line breaking (Knuth-Plass style).
+
+    Greedy wrapping tends to strand a stubby last line, which hurts
+    glanceability mid-read. Minimizing the sum of squared slack over
+    all lines but the last gives balanced lines for the same cost
+    budget: a small DP per phrase at load time, nothing per frame.
+    """
+    words = phrase.split()
+    if not words:
+        return ['']
+    n = len(words)
+    inf = float('inf')
+    best = [0.0] + [inf] * n
+    brk = [0] * (n + 1)
+    for i in range(1, n + 1):
+        length = -1
+        for j in range(i, 0, -1):
+            length += len(words[j - 1]) + 1
+            if length > width and j < i:
+                break
+            slack = width - length
+            if slack < 0:
+                slack = 0  # lone word wider than the screen
+            cost = best[j - 1] + (0 if i == n else slack * slack)
+            if cost < best[i]:
+                best[i] = cost
+                brk[i] = j - 1
+    lines = []
+    i = n
+    while i > 0:
+        lines.append(' '.join(words[brk[i]:i]))
+        i = brk[i]
+    lines.reverse()
+    return lines
+
+
+def _recompute(*_):
+    global TERM_W, TERM_H, _wrapped, _last_rows
+    try:
+        size = os.get_terminal_size()
+    except OSError:
+        return
+    TERM_W, TERM_H = size.columns, size.lines
+    width = min(TERM_W - 4, 80)
+    _wrapped = [_optimal_wrap(p, width) for p in _phrases]
+    _frame_cache.clear()
+    _last_rows = None
+
+
+def set_phrases(phrases):
+    global _phrases
+    _phrases = phrases
+    _recompute()
+    if hasattr(signal, 'SIGWINCH'):
+        signal.signal(signal.SIGWINCH, _recompute)
+
+
+def _footer(current, total, voice_on):
+    status = "🎤 voice" if voice_on else "⏸ manual"
+    return f"{status} | {current + 1}/{total} | ENTER next | B back | V voice | Q quit"
+
+
+def _render_rows(current, total, voice_on):
+    """Lay out one frame as {1-based row: styled line}.
+
+    Cached row dicts double as the diff baseline in display_phrase, so
+    they must never be mutated after this returns.
+    """
+    w, h = TERM_W, TERM_H
+    lines = _wrapped[current]
+    top = max((h - len(lines)) // 2 - 1, 0)
+
+    rows = {}
+    for i, l in enumerate(lines):
+        rows[top + 1 + i] = _BOLD_WHITE + l.center(w) + _RESET
+    rows[h - 2] = _DIM + _footer(current, total, voice_on).center(w) + _RESET
+    return rows
+
+
+def display_phrase(current, total, voice_on):
+    # Double-buffered diff: compare the wanted frame against what is on
+    # screen and rewrite only the rows that differ, in one write. A
+    # voice toggle touches just the footer row; stepping between
+    # same-length phrases never clears the screen, so there is no blank
+    # flash between frames. Rows come from a per-(phrase, voice) cache,
+    # so unchanged rows usually compare by identity.
+    global _last_rows
+    key = (current, voice_on)
+    rows = _frame_cache.get(key)
+    if rows is None:
+        rows = _frame_cache[key] = _render_rows(current, total, voice_on)
+
+    out = []
+    if _last_rows is None:
+        out.append(_CLEAR_HOME)
+        for row in sorted(rows):
+            out.append(f'\x1b[{row};1H{rows[row]}')
+    else:
+        for row in _last_rows.keys() - rows.keys():
+            out.append(f'\x1b[{row};1H\x1b[2K')
+        for row, text in rows.items():
+            if _last_rows.get(row) != text:
+                out.append(f'\x1b[{row};1H\x1b[2K{text}')
+    _last_rows = rows
+    if out:
+        os.write(sys.stdout.fileno(), ''.join(out).encode('utf-8'))
+
+
+class VADWorker(threading.Thread):
+    """Watches the microphone and flags the end of each utterance.
+
+    Opens the input stream once, reads 32ms frames, and runs an
+    RMS-energy detector with hysteresis: speech starts when energy
+    rises above the start threshold and ends after `pause` seconds of
+    consecutive frames below the (lower) end threshold. Each detected
+    pause writes a byte to `wake_fd` so the main loop's selector wakes.
+    """
+
+    def __init__(self, pause, wake_fd, recalibrate=False):
+        super().__init__(daemon=True)
+        self._wake_fd = wake_fd
+        self._recalibrate = recalibrate
+        self.enabled = threading.Event()
+        self.enabled.set()
+        self.redemption_frames = max(int(pause / FRAME_SECONDS), 1)
+        # PortAudio's own thread delivers frames to a queue via the
+        # callback; this thread never touches the device after open
+        self._frames = queue.Queue(maxsize=64)
+        self._pa = pyaudio.PyAudio()
+        self._stream = self._pa.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=SAMPLE_RATE,
+            input=True,
+            frames_per_buffer=FRAME_SAMPLES,
+            stream_callback=self._on_audio,
+        )
+        self._calibrate()
+
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        try:
+            self._frames.put_nowait(in_data)
+        except queue.Full:
+            pass  # stale audio is useless for pause detection; drop it
+        return (None, pyaudio.paContinue)
+
+    def _calibrate(self):
+        """Seed the energy thresholds from cache or ambient noise."""
+        noise = None if self._recalibrate else _load_cached_noise()
+        if noise is None:
+            frames = max(int(CALIBRATION_SECONDS / FRAME_SECONDS), 1)
+            total = 0
+            for _ in range(frames):
+                total += _frame_rms(self._frames.get(timeout=2))
+            noise = total / frames
+            _save_cached_noise(noise)
+        self._noise = noise
+        self._update_thresholds()
+
+    def _update_thresholds(self):
+        self.start_threshold = max(self._noise * 3.0, 300)
+        self.end_threshold = max(self._noise * 2.0, 200)
+
+    def run(self):
+        speaking = False
+        silence_frames = 0
+        while True:
+            if not self.enabled.is_set():
+                self.enabled.wait()
+                # Drop whatever arrived while muted so a backlog of old
+                # speech can't trigger a phantom advance on re-enable
+                while not self._frames.empty():
+                    if self._frames.get_nowait() is None:
+                        return
+                speaking = False
+                silence_frames = 0
+                continue
+            data = self._frames.get()
+            if data is None:  # shutdown sentinel from stop()
+                return
+            rms = _frame_rms(data)
+            if speaking:
+                if rms < self.end_threshold:
+                    silence_frames += 1
+                    if silence_frames >= self.redemption_frames:
+                        speaking = False
+                        os.write(self._wake_fd, b'\x01')
+                else:
+                    silence_frames = 0
+            elif rms > self.start_threshold:
+                speaking = True
+                silence_frames = 0
+            else:
+                # Quiet frame: let the noise floor drift with the room
+                self._noise += 0.05 * (rms - self._noise)
+                self._update_thresholds()
+
+    def stop(self):
+        self.enabled.set()
+        self._frames.put(None)
+        try:
+            self._stream.stop_stream()
+            self._stream.close()
+        finally:
+            self._pa.terminate()
+
+
+def run_prompter(phrases, worker, wake_fd=None):
+    total = len(phrases)
+    current = 0
+    voice_on = worker is not None
+
+    # One selector over stdin and the VAD wake pipe: the loop sleeps in
+    # the kernel until a keypress or a detected pause, no polling
+    sel = selectors.DefaultSelector()
+    sel.register(sys.stdin, selectors.EVENT_READ, 'key')
+    if wake_fd is not None:
+        sel.register(wake_fd, selectors.EVENT_READ, 'voice')
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    sys.stdout.flush()  # don't let banner output interleave with raw frames
+    try:
+        tty.setcbreak(fd)
+        while 0 <= current < total:
+            display_phrase(current, total, voice_on)
+            moved = False
+            while not moved:
+                for key, _ in sel.select():
+                    if key.data == 'voice':
+                        os.read(wake_fd, 64)
+                        if voice_on:
+                            current += 1
+                            moved = True
+                        continue
+                    # Read the whole burst (held key, paste) in one
+                    # syscall instead of one read(2) per byte
+                    for b in os.read(fd, 32):
+                        ch = chr(b).lower()
+                        if ch == 'q':
+                            return
+                        elif ch in ('\n', '\r', ' '):
+                            current += 1
+                            moved = True
+                        elif ch == 'b':
+                            current = max(current - 1, 0)
+                            moved = True
+                        elif ch == 'v' and worker:
+                            voice_on = not voice_on
+                            if voice_on:
+                                worker.enabled.set()
+                            else:
+                                worker.enabled.clear()
+                            display_phrase(current, total, voice_on)
+                    if moved:
+                        break
+    finally:
+        sel.close()
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Voice-activated teleprompter - advances when you stop speaking"
+    )
+    parser.add_argument("script", help="Text file")
+    parser.add_argument("--manual", action="store_true", help="Keyboard only, no microphone")
+    parser.add_argument("--pause", type=float, default=1.5,
+                        help="Silence (seconds) that ends a phrase (default: 1.5)")
+    parser.add_argument("--recalibrate", action="store_true",
+                        help="Redo mic calibration instead of using the cached profile")
+    parser.add_argument("--split", choices=sorted(SPLITTERS), default="sentence",
+                        help="Advance per sentence or per paragraph (default: sentence)")
+    parser.add_argument("-v", "--version", action="version", version="%(prog)s 0.3.4")
+
+    args = parser.parse_args()
+
+    if os.name == 'nt':
+        os.system('')  # enable ANSI escape processing on Windows 10+
+
+    if not os.path.exists(args.script):
+        print(f"Error: {args.script} not found")
+        sys.exit(1)
+
+    # Load in the background; the banner sleep (and mic calibration)
+    # hide the read time anyway. An exception is carried back and
+    # re-raised after join instead of dying in the thread.
+    loaded = []
+
+    def _load():
+        try:
+            loaded.append(SPLITTERS[args.split](args.script))
+        except Exception as e:
+            loaded.append(e)
+
+    loader = threading.Thread(target=_load, daemon=True)
+    loader.start()
+
+    print(f"📜 {os.path.basename(args.script)}")
+    print("💡 Cmd + for bigger font")
+    if args.manual:
+        worker = None
+        wake_r = None
+    else:
+        print("🎤 Calibrating mic...")
+        wake_r, wake_w = os.pipe()
+        worker = VADWorker(args.pause, wake_w, recalibrate=args.recalibrate)
+        worker.start()
+    time.sleep(1)
+
+    loader.join()
+    if isinstance(loaded[0], Exception):
+        if worker:
+            worker.stop()
+        raise loaded[0]
+    phrases = loaded[0]
+
+    if not phrases:
+        print("Error: No text")
+        if worker:
+            worker.stop()
+        sys.exit(1)
+
+    set_phrases(phrases)
+
+    try:
+        run_prompter(phrases, worker, wake_r)
+    finally:
+        if worker:
+            worker.stop()
+        clear_screen()
+    print("Done! 🎬")
+
+
+if __name__ == "__main__":
+    main()